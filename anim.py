@@ -17,19 +17,25 @@ def init_stars(screen):
 def move_and_draw_stars(screen):
   """ Move and draw the stars """
   global stars
+  # Bind the per-star lookups once per frame
+  height = screen.get_height()
+  set_at = screen.set_at
   for star in stars:
     star[1] += STAR_SPEED
-    if star[1] >= screen.get_height():
+    if star[1] >= height:
       star[1] = 0
       star[0] = randrange(0,639)
  
-    screen.set_at(star,(255,255,255))
+    set_at(star,(255,255,255))
 
 def main():
   pygame.init()
   screen = pygame.display.set_mode((640,480))
   pygame.display.set_caption("Starfield Simulation")
   clock = pygame.time.Clock()
+  # Only QUIT is handled: keep every other event out of the queue
+  pygame.event.set_blocked(None)
+  pygame.event.set_allowed(pygame.QUIT)
  
   init_stars(screen)
  
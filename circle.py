@@ -3,8 +3,11 @@ from robomaster import robot
 from robomaster import camera
 import cv2
 import numpy as np
-import keyboard
 import math
+import functools
+
+## print per-step / per-move progress while moving
+VERBOSE = False
 
 def init():
     ep_robot = robot.Robot()
@@ -19,45 +22,89 @@ def positionCB(position_info):
     print("Robot position: {0},{1},{2}".format(x,y,z)) 
 
 
+## chassis.move only accepts x and y in [-5, 5] m per action
+MAX_MOVE_XY = 5.0
+
+## one waypoint per row, one column per chassis.move argument
+## float32 is plenty for mm / 0.1 degree chassis moves
+WAYPOINT_DTYPE = np.dtype([('x', np.float32), ('y', np.float32), ('z', np.float32), ('xy_speed', np.float32), ('z_speed', np.float32)])
+
 def makeLinePositions():
 
-    pos=[]
     nbSteps=20
-    for i in range(1,nbSteps):
-        pos.append({'x':0,'y':0.2,'z':0, 'xy_speed':0.5, 'z_speed':0})   
+    pos=np.zeros(nbSteps-1, dtype=WAYPOINT_DTYPE)
+    pos['y'] = 0.2
+    pos['xy_speed'] = 0.5
     return pos
 
-def makeCirclePositions(r):
+def makeCirclePositions(r, nbSteps=50, speedRatio=4):
+    ## plans are cached per (r, nbSteps, speedRatio): hand out a private copy
+    return _buildCircle(r, nbSteps, speedRatio).copy()
 
-    ## reverse to start position
-    pos=[]
-    pos.append({'x':-r,'y':0,'z':0, 'xy_speed':0.5, 'z_speed':30})
+@functools.lru_cache(maxsize=32)
+def _buildCircle(r, nbSteps, speedRatio):
 
     ## start circle
-    nbSteps=50
     alpha = 360/nbSteps
-    ## sin(alpha) = dy / R 
-    yStep = round(r*math.sin(alpha/360 *(2*math.pi)),2) 
-    speedRatio=4    
-    for i in range(1,nbSteps):
-        print("step " + str(i))
-        pos.append({'x':0,'y':yStep,'z':alpha, 'xy_speed':speedRatio*yStep, 'z_speed':speedRatio*alpha})   
+    alpha_rad = math.radians(alpha)
+    ## the robot faces the center and turns by alpha on each step. RM rotates
+    ## before it translates (see sim_chassis.py), so every step is the same chord
+    ## of the circle (length 2*R*sin(alpha/2)) seen from the already turned frame:
+    ## dx = -R*(1-cos(alpha)) away from the center, dy = R*sin(alpha) along the tangent
+    xStep = -r*(1-math.cos(alpha_rad))
+    yStep = r*math.sin(alpha_rad)
+
+    ## start move + nbSteps chords (a full turn) + return to the center
+    pos=np.zeros(nbSteps+2, dtype=WAYPOINT_DTYPE)
+
+    ## reverse to start position
+    pos[0] = (-r, 0, 0, 0.5, 30)
 
-    pos.append({'x':r,'y':0,'z':0, 'xy_speed':0.5, 'z_speed':30})
+    ## every step is the same move: fill the columns in one go
+    steps = pos[1:nbSteps+1]
+    steps['x'] = xStep
+    steps['y'] = yStep
+    steps['z'] = alpha
+    steps['xy_speed'] = speedRatio*math.hypot(xStep, yStep)
+    steps['z_speed'] = speedRatio*alpha
 
+    pos[nbSteps+1] = (r, 0, 0, 0.5, 30)
+
+    ## shared by every caller of the cache
+    pos.flags.writeable = False
     return pos
 
+def fusePositions(pos):
+    ## consecutive pure translations in the same direction at the same speed
+    ## are a single longer move for the robot: merge them so playPositions
+    ## sends one chassis.move (and waits for one completion) instead of N,
+    ## as long as the merged move stays within MAX_MOVE_XY
+    rows=[]
+    for p in pos:
+        x, y, z, xy_speed, z_speed = p.item()
+        if rows:
+            last = rows[-1]
+            if (z == 0 and last[2] == 0 and xy_speed == last[3]
+                    and abs(last[0]*y - last[1]*x) < 1e-9 and last[0]*x + last[1]*y > 0
+                    and math.hypot(last[0]+x, last[1]+y) <= MAX_MOVE_XY):
+                last[0] += x
+                last[1] += y
+                continue
+        rows.append([x, y, z, xy_speed, z_speed])
+    return np.array([tuple(r) for r in rows], dtype=WAYPOINT_DTYPE)
+
 def playPositions(chassis, pos):
     
+    pos = fusePositions(pos)
     i=0
     for p in pos:
-        t0=time.time()
+        t0=time.monotonic()
         i+=1
-        action=chassis.move(x=p['x'],y=p['y'],z=p['z'], xy_speed=p['xy_speed'], z_speed=p['z_speed'])   
-        action.wait_for_completed()
-        #waitAction(action)
-        time.sleep(0.2)
-        print("completed move {0} in {1} s".format(i, time.time()-t0) )
+        x, y, z, xy_speed, z_speed = p.item()
+        action=chassis.move(x=x,y=y,z=z, xy_speed=xy_speed, z_speed=z_speed)   
+        waitAction(action)
+        if VERBOSE:
+            print("completed move {0} in {1} s".format(i, time.monotonic()-t0) )
         
 
 def makeCircle(chassis, r):
@@ -78,22 +125,21 @@ def makeCircle(chassis, r):
     speedRatio=4
     
     for i in range(1,nbSteps):
-        print("step " + str(i))
+        if VERBOSE:
+            print("step {0}".format(i))
         action=chassis.move(x=0,y=yStep,z=alpha, xy_speed=speedRatio*yStep, z_speed=speedRatio*alpha)   
         #action.wait_for_completed()
         waitAction(action)
         #time.sleep(1)
-        #if keyboard.is_pressed('q'):
-        #    print("Exit")
-        #    break
     
     action=chassis.move(x=r,y=0,z=0, xy_speed=0.5, z_speed=30)   
     action.wait_for_completed()
     
    
 def waitAction(action):
-    while not action.is_completed:
-        time.sleep(0.01)
+    ## the SDK action sets an event when the robot reports completion:
+    ## block on it instead of polling is_completed
+    return action.wait_for_completed()
 
 if __name__ == '__main__':
     
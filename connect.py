@@ -26,17 +26,29 @@ if __name__ == '__main__':
     
     #while not action.wait_for_completed(timeout=0.1):
     #for i in range(0, 30):
+    # run the loop every 0.2s, whatever time the frame processing takes
+    period = 0.2
+    next_tick = time.monotonic()
+    # side by side [input | detections] image, reused across frames
+    side = None
     while action._percent < 95:
         img = ep_camera.read_cv2_image(strategy="newest")
         cv2.imshow("Robot", img)
-        cv2.waitKey(1)
+        cv2.pollKey()
         #print(img)
         print(action._percent)
         print(action._state)
-        output = img.copy()
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         circles = cv2.HoughCircles(gray, cv2.HOUGH_GRADIENT, 1.2, 100)
         if circles is not None:
+            # only copy the frame when there is something to draw on it,
+            # straight into the right half of the side by side image
+            h, w = img.shape[:2]
+            if side is None or side.shape != (h, 2*w, img.shape[2]):
+                side = np.empty((h, 2*w, img.shape[2]), dtype=img.dtype)
+            side[:, :w] = img
+            output = side[:, w:]
+            output[:] = img
             # convert the (x, y) coordinates and radius of the circles to integers
             circles = np.round(circles[0, :]).astype("int")
             # loop over the (x, y) coordinates and radius of the circles
@@ -46,9 +58,11 @@ if __name__ == '__main__':
                 cv2.circle(output, (x, y), r, (0, 255, 0), 4)
                 cv2.rectangle(output, (x - 5, y - 5), (x + 5, y + 5), (0, 128, 255), -1)
             # show the output image
-            cv2.imshow("output", np.hstack([img, output]))
+            cv2.imshow("output", side)
 
-        time.sleep(0.2)
+        # resync after an overrun instead of running the late iterations back to back
+        next_tick = max(next_tick + period, time.monotonic())
+        time.sleep(max(0, next_tick - time.monotonic()))
 
     action.wait_for_completed()
     
@@ -2,6 +2,7 @@
 from vector import Vector
 import pygame
 import math
+from collections import deque
 
 class Chassis:
 
@@ -10,21 +11,25 @@ class Chassis:
     def __init__(self, img, fps):
         self.img=img
         self.pos = Vector(0,0,0)
-        self._positions=[]
+        ## queued positions, replayed one per frame from the left
+        self._positions=deque()
         self.fps=fps
         self.w=img.get_size()[0]
         self.h=img.get_size()[1]
-        self._tail=[]
+        ## bounded: appending past TAIL_SIZE drops the oldest point
+        self._tail=deque(maxlen=Chassis.TAIL_SIZE)
+        self._tailShades=[]
+        ## rotated sprites, rendered once per integer degree
+        self._sprites={}
  
     def _appendToTail(self,v):
-        if (len(self._tail)>Chassis.TAIL_SIZE):
-            self._tail.pop(0)            
-        self._tail.append(v)
+        ## only the pixel is needed to draw the tail
+        self._tail.append((int(v.x),int(v.y)))
         
     def draw(self, screen, center, scale):
         if (len(self._positions)>0):
             self._nextPosition()
-        sprite = pygame.transform.rotate(self.img, self.pos.z)
+        sprite = self._getSprite(self.pos.z)
         
         targetVector=Vector(center.x+self.pos.x*scale-0*self.w/2, center.y+self.pos.y*scale-0*self.h/2, self.pos.z)
         self._appendToTail(targetVector)
@@ -37,13 +42,25 @@ class Chassis:
 
         screen.blit(sprite, new_rect.topleft)    
 
+    def _getSprite(self, angle):
+        key = round(angle) % 360
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.transform.rotate(self.img, key)
+            self._sprites[key] = sprite
+        return sprite
+
     def _drawTail(self, screen):
         l=len(self._tail)
-        idx=0
-        for t in self._tail:
-            idx+=1
-            c = 255-(200* (l-idx)/l)
-            screen.set_at([int(t.x),int(t.y)], (c,c,c))
+        ## the fade only depends on the tail length, which is constant once full
+        if len(self._tailShades)!=l:
+            self._tailShades=[(c,c,c) for c in (255-(200* (l-idx)/l) for idx in range(1,l+1))]
+        ## lock once for the whole tail instead of once per set_at
+        set_at=screen.set_at
+        screen.lock()
+        for t, c in zip(self._tail, self._tailShades):
+            set_at(t, c)
+        screen.unlock()
 
     def _getLastPosition(self):
         prev = Vector(self.pos)
@@ -66,15 +83,18 @@ class Chassis:
 
         ## then we execute the x/y moves 
         nbSteps = math.ceil(abs(dxy/(sxy/self.fps)))        
+
+        ## the heading does not change during the x/y moves:
+        ## compute sin/cos once, cos(a-90) = sin(a) and sin(a-90) = -cos(a)
+        if nbSteps == 0:
+            return
+        a1 = math.radians(self._getLastPosition().z)
+        c, s = math.cos(a1), math.sin(a1)
+        dx = (1/nbSteps)*(x*c + y*s)
+        dy = (1/nbSteps)*(y*c - x*s)
+
         for i in range(nbSteps):
             cp = self._getLastPosition()
-        
-            a1=cp.z/360 *(2*math.pi)
-            a2=(cp.z-90)/360 *(2*math.pi)
-
-            dx = (1/nbSteps)*x* math.cos(a1) + (1/nbSteps)*y* math.cos(a2)
-            dy = -(1/nbSteps)*x* math.sin(a1) - (1/nbSteps)*y* math.sin(a2)        
-            
             cp += Vector(dx,dy,0)
             #print(cp)
             
@@ -117,7 +137,7 @@ class Chassis:
             self._positions.append(cp.round(2))
 
     def _nextPosition(self):
-        self.pos = self._positions.pop(0)    
+        self.pos = self._positions.popleft()
 
     @property
     def positions(self):
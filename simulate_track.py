@@ -14,6 +14,9 @@ def main():
   pygame.display.set_caption("Robot Simulation")
   clock = pygame.time.Clock()
   fps=60
+  ## only QUIT and key presses are handled: keep other events out of the queue
+  pygame.event.set_blocked(None)
+  pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
 
   ## Create the Chassis used for simulation
   main_dir = os.path.split(os.path.abspath(__file__))[0]
@@ -51,6 +54,24 @@ def main():
   
   curTrack['track'].loadMoves(chassis)
 
+  def replayTrack():
+    curTrack['track'].loadMoves(chassis)
+
+  def prevTrack():
+    print("prev track")
+    setCurrentTrack(curTrack['idx']-1)
+
+  def nextTrack():
+    print("next track")
+    setCurrentTrack(curTrack['idx']+1)
+
+  keyActions = {
+            pygame.K_RIGHT: replayTrack,
+            pygame.K_LEFT: replayTrack,
+            pygame.K_UP: prevTrack,
+            pygame.K_DOWN: nextTrack
+  }
+
   center = Vector(400, 300, 0)
 
   while True:
@@ -61,16 +82,9 @@ def main():
       if event.type == pygame.QUIT:
         return
       elif event.type == pygame.KEYDOWN:
-        if event.key == 1073741903:
-            curTrack['track'].loadMoves(chassis)                        
-        elif event.key == 1073741904:
-            curTrack['track'].loadMoves(chassis)                        
-        elif event.key == 1073741906: # UP
-            print("prev track")
-            setCurrentTrack(curTrack['idx']-1)
-        elif event.key == 1073741905: # DOWN
-            print("next track")
-            setCurrentTrack(curTrack['idx']+1)
+        action = keyActions.get(event.key)
+        if action is not None:
+            action()
        
         print (event.key)
  
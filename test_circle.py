@@ -0,0 +1,119 @@
+import math
+import sys
+import types
+import unittest
+
+# circle.py drives the robot through the RoboMaster SDK and imports OpenCV:
+# stub them when missing, the planning functions need neither
+try:
+    import robomaster
+except ImportError:
+    robomaster = types.ModuleType("robomaster")
+    robomaster.robot = types.ModuleType("robomaster.robot")
+    robomaster.camera = types.ModuleType("robomaster.camera")
+    sys.modules["robomaster"] = robomaster
+    sys.modules["robomaster.robot"] = robomaster.robot
+    sys.modules["robomaster.camera"] = robomaster.camera
+try:
+    import cv2
+except ImportError:
+    sys.modules["cv2"] = types.ModuleType("cv2")
+
+import circle
+
+class TestCirclePositions(unittest.TestCase):
+
+    def test_circle_chord(self):
+        r = 0.6
+        nbSteps = 50
+        alpha = 360/nbSteps
+        pos = circle.makeCirclePositions(r, nbSteps)
+
+        ## start move, a full turn of nbSteps chords, return to the center
+        self.assertEqual(nbSteps+2, len(pos))
+
+        ## reverse to the circle, then come back to the center
+        for expected, row in [((-r,0,0,0.5,30), pos[0]), ((r,0,0,0.5,30), pos[-1])]:
+            for e, v in zip(expected, row.item()):
+                self.assertAlmostEqual(e, v, places=5)
+
+        ## every step in between is the same chord of the circle, expressed in the
+        ## frame the robot has after its rotation (rotate first, like sim_chassis.py)
+        alpha_rad = math.radians(alpha)
+        chord = 2*r*math.sin(alpha_rad/2)
+        for p in pos[1:nbSteps+1]:
+            x, y, z, xy_speed, z_speed = p.item()
+            self.assertAlmostEqual(-r*(1-math.cos(alpha_rad)), x, places=6)
+            self.assertAlmostEqual(r*math.sin(alpha_rad), y, places=6)
+            self.assertAlmostEqual(chord, math.hypot(x, y), places=6)
+            self.assertAlmostEqual(alpha, z, places=5)
+
+    def test_rotate_first_replay_stays_on_circle(self):
+        r = 0.6
+        pos = circle.makeCirclePositions(r, 50)
+
+        ## replay the plan with the sim_chassis.py model: rotate by z, then
+        ## translate by (x, y) in the rotated frame; the center stays at (0, 0)
+        px, py, heading = 0.0, 0.0, 0.0
+        for i, (x, y, z, xy_speed, z_speed) in enumerate(pos.tolist()):
+            heading += z
+            a = math.radians(heading)
+            px += x*math.cos(a) + y*math.sin(a)
+            py += y*math.cos(a) - x*math.sin(a)
+            if i < len(pos)-1:
+                self.assertAlmostEqual(r, math.hypot(px, py), places=5)
+
+        ## one full turn, back to the center
+        self.assertAlmostEqual(360, heading, places=3)
+        self.assertAlmostEqual(0, px, places=5)
+        self.assertAlmostEqual(0, py, places=5)
+
+    def test_cached_plan_is_not_shared(self):
+        pos = circle.makeCirclePositions(0.6)
+        pos['x'] = 1
+        pos['z'] = 0
+
+        pos = circle.makeCirclePositions(0.6)
+        self.assertAlmostEqual(-0.6, pos[0]['x'], places=5)
+        self.assertAlmostEqual(7.2, pos[1]['z'], places=5)
+
+class TestFusePositions(unittest.TestCase):
+
+    def _positions(self, rows):
+        return circle.np.array(rows, dtype=circle.WAYPOINT_DTYPE)
+
+    def test_line_is_one_move(self):
+        pos = circle.fusePositions(circle.makeLinePositions())
+
+        self.assertEqual(1, len(pos))
+        x, y, z, xy_speed, z_speed = pos[0].item()
+        self.assertAlmostEqual(0, x)
+        self.assertAlmostEqual(3.8, y, places=5)
+        self.assertEqual(0, z)
+
+    def test_circle_steps_are_kept(self):
+        pos = circle.makeCirclePositions(0.6)
+
+        self.assertEqual(len(pos), len(circle.fusePositions(pos)))
+
+    def test_opposite_moves_are_kept(self):
+        pos = self._positions([(0.5,0,0,1,0), (-0.5,0,0,1,0), (0.5,0,0,1,0)])
+
+        self.assertEqual(3, len(circle.fusePositions(pos)))
+
+    def test_empty(self):
+        pos = circle.fusePositions(self._positions([]))
+
+        self.assertEqual(0, len(pos))
+
+    def test_merged_move_is_capped(self):
+        pos = circle.fusePositions(self._positions([(0,0.2,0,0.5,0)]*30))
+
+        self.assertEqual(2, len(pos))
+        for p in pos:
+            self.assertLessEqual(math.hypot(p['x'], p['y']), circle.MAX_MOVE_XY)
+        self.assertAlmostEqual(6.0, float(pos['y'].sum()), places=4)
+
+if __name__ == "__main__":
+  print("running tests")
+  unittest.main()
@@ -98,9 +98,9 @@ class Vector(object):
         return self.__class__(*scaled)
     
     def round(self, digits):
-        """ scale one vector using the second one
+        """ Returns a copy of the vector with each component rounded to digits
         """
-        rounded = tuple(round(a,digits) for a in self)
+        rounded = [round(a,digits) for a in self.values]
         return self.__class__(*rounded)
     
     def __mul__(self, other):
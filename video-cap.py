@@ -5,13 +5,18 @@ import numpy as np
 if __name__ == '__main__':
 
     cam = cv2.VideoCapture(0)
+    # keep at most one frame queued so the preview shows the newest image,
+    # and ask for MJPG so the camera sends compressed frames
+    cam.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    cam.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
     
     cv2.namedWindow('Display')
     success, img = cam.read()
 
-    while success and cv2.waitKey(1)==-1:
+    while success and cv2.pollKey()==-1:
         cv2.imshow('Display', img)
-        success, img = cam.read()
+        # decode the next frame into the same buffer instead of a new array
+        success, img = cam.read(img)
     
     cv2.destroyAllWindows()
     cam.release()